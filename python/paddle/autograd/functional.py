@@ -12,37 +12,293 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+from paddle.fluid import core
 from paddle.fluid import framework
 import paddle
 
 
 def _check_tensors(in_out_list, name):
-    assert in_out_list is not None, "{} should not be None".format(name)
+    if in_out_list is None:
+        raise ValueError("{} should not be None".format(name))
 
     if isinstance(in_out_list, (list, tuple)):
-        assert len(in_out_list) > 0, "{} connot be empyt".format(name)
-        for each_var in in_out_list:
-            assert isinstance(
-                each_var,
-                paddle.Tensor), "Elements of {} must be paddle.Tensor".format(
-                    name)
+        if len(in_out_list) == 0:
+            raise ValueError("{} cannot be empty".format(name))
+        if not all(isinstance(v, paddle.Tensor) for v in in_out_list):
+            raise TypeError("Elements of {} must be paddle.Tensor".format(
+                name))
         return in_out_list
-    else:
-        assert isinstance(
-            in_out_list,
-            paddle.Tensor), "{} must be Tensor or list of Tensor".format(name)
+    elif isinstance(in_out_list, paddle.Tensor):
         return [in_out_list]
+    else:
+        raise TypeError("{} must be Tensor or list of Tensor".format(name))
 
 
-def _stack_tensor_or_return_none(origin_list):
+def _stack_tensor_or_return_none(origin_list, axis=0):
     assert len(origin_list) > 0, "Can't not stack an empty list"
     return paddle.stack(
-        origin_list, axis=0) if isinstance(origin_list[0],
-                                           paddle.Tensor) else None
+        origin_list, axis=axis) if isinstance(origin_list[0],
+                                              paddle.Tensor) else None
+
+
+def _unpack_jacobian(jacobian, fin_size, fout_size):
+    if fin_size == 1 and fout_size == 1:
+        return jacobian[0][0]
+    elif fin_size == 1 and fout_size != 1:
+        return tuple(jacobian[i][0] for i in range(fout_size))
+    elif fin_size != 1 and fout_size == 1:
+        return jacobian[0]
+    else:
+        return jacobian
+
+
+def _move_axis_to_front(t, axis):
+    axis = axis % len(t.shape)
+    if axis == 0:
+        return t
+    perm = [axis] + [d for d in range(len(t.shape)) if d != axis]
+    return paddle.transpose(t, perm=perm)
+
+
+def _numel(t):
+    size = 1
+    for d in t.shape:
+        size *= d
+    return size
+
+
+def _make_vjp(inputs, create_graph, allow_unused):
+    # paddle.grad validates its arguments and resolves the place on every
+    # call. The Jacobian loops run many backward passes against the same
+    # inputs, so do that once and call the partial grad engine directly.
+    inputs = list(inputs)
+    place = core.Place()
+    place.set_place(framework._current_expected_place())
+
+    partial_grad = core.dygraph_partial_grad
+
+    # ``outputs`` and ``grad_outputs`` must be lists, they are handed to the
+    # engine as they are.
+    def vjp_fn(outputs, grad_outputs=None, retain_graph=True):
+        return partial_grad(inputs, outputs, []
+                            if grad_outputs is None else grad_outputs, [],
+                            place, create_graph, retain_graph, allow_unused,
+                            True)
+
+    return vjp_fn
+
+
+def _jacobian_rows(flat_output,
+                   inputs,
+                   create_graph,
+                   allow_unused,
+                   release_graph=False):
+    fin_size = len(inputs)
+    if not create_graph:
+        return _preallocated_jacobian_rows(flat_output, inputs, allow_unused,
+                                           release_graph)
+    vjp_fn = _make_vjp(inputs, create_graph, allow_unused)
+    jac_i = list([] for _ in range(fin_size))
+    for k in range(len(flat_output)):
+        row_k = vjp_fn([flat_output[k]])
+        for j in range(fin_size):
+            jac_i[j].append(row_k[j])
+    # Rows are stacked in their input shape and flattened with one reshape
+    # per input rather than one per row.
+    jac_i = tuple(_stack_tensor_or_return_none(jac_i_j) for jac_i_j in jac_i)
+    return tuple(
+        paddle.reshape(
+            jac_i_j, shape=[len(flat_output), -1])
+        if isinstance(jac_i_j, paddle.Tensor) else None for jac_i_j in jac_i)
+
+
+def _preallocated_jacobian_rows(flat_output, inputs, allow_unused,
+                                release_graph):
+    # Without create_graph the rows need not stay differentiable, so they are
+    # written straight into one buffer per input instead of being collected
+    # and stacked. Whether an input is reachable only depends on the graph,
+    # so the first row decides which buffers exist.
+    # NOTE: the rows are independent but are all issued on the current CUDA
+    # stream on purpose. The allocator is not stream aware, so temporaries
+    # freed by one backward pass could be handed to a pass running on another
+    # stream before the first one has finished with them.
+    vjp_fn = _make_vjp(inputs, False, allow_unused)
+    n = len(flat_output)
+    # With release_graph, the last backward pass lets the engine free the
+    # saved forward tensors right away instead of at function exit.
+    row_k = vjp_fn([flat_output[0]],
+                   retain_graph=not (release_graph and n == 1))
+    # The buffers keep the input shapes so rows are written without a
+    # reshape each, and are flattened once at the end.
+    jac_i = tuple(
+        paddle.empty(
+            [n] + list(x.shape), dtype=x.dtype)
+        if isinstance(row, paddle.Tensor) else None
+        for x, row in zip(inputs, row_k))
+    reachable = [(j, buf) for j, buf in enumerate(jac_i) if buf is not None]
+    for k in range(n):
+        if k > 0:
+            row_k = vjp_fn([flat_output[k]],
+                           retain_graph=not (release_graph and k == n - 1))
+        for j, buf in reachable:
+            buf[k] = row_k[j]
+        # Release the gradients of this row before the next backward pass
+        # allocates its own, so at most one row is alive besides the buffers.
+        del row_k
+    return tuple(
+        paddle.reshape(
+            buf, shape=[n, -1]) if buf is not None else None for buf in jac_i)
+
+
+def _vectorized_jacobian(func, inputs, outputs, create_graph, allow_unused):
+    # Evaluate ``func`` once on inputs replicated ``n`` times along a new
+    # leading axis, where ``n`` is the total number of output elements, and
+    # pull every row of every Jacobian block back with a single VJP whose
+    # cotangents together form an identity matrix. Returns None if ``func``
+    # does not broadcast over the leading axis.
+    #
+    # Two extra replicas shifted by +1 and -2 are appended and get zero
+    # cotangents. A ``func`` which mixes the replicas, e.g. through
+    # ``paddle.sum(x)``, ``paddle.mean(x)`` or ``x.max()``, then sees them
+    # and no longer reproduces the unbatched outputs on the first replica.
+    # Shifting up and down by different amounts moves the sum, the mean,
+    # the maximum and the minimum alike. Unlike the row-by-row path, an
+    # output which does not reach some input gets a zero block for it even
+    # when ``allow_unused`` is False.
+    out_sizes = [_numel(output) for output in outputs]
+    n = sum(out_sizes)
+    tiled_inputs = []
+    for x in inputs:
+        replicas = paddle.tile(
+            paddle.unsqueeze(
+                x, axis=0), repeat_times=[n] + [1] * len(x.shape))
+        shifted = paddle.stack([x + 1., x - 2.], axis=0)
+        tiled_inputs.append(paddle.concat([replicas, shifted], axis=0))
+    try:
+        tiled_outputs = _check_tensors(func(*tiled_inputs), "outputs")
+    except Exception:
+        return None
+    if len(tiled_outputs) != len(outputs):
+        return None
+    for tiled_output, output in zip(tiled_outputs, outputs):
+        if list(tiled_output.shape) != [n + 2] + list(output.shape):
+            return None
+        if not bool(paddle.allclose(tiled_output[0], output)):
+            return None
+    identity = paddle.eye(n + 2, n, dtype=tiled_outputs[0].dtype)
+    grad_outputs = [
+        paddle.reshape(
+            paddle.cast(
+                cotangent, dtype=tiled_output.dtype),
+            shape=tiled_output.shape)
+        for cotangent, tiled_output in zip(
+            paddle.split(
+                identity, out_sizes, axis=1), tiled_outputs)
+    ]
+    rows = paddle.grad(
+        tiled_outputs,
+        tiled_inputs,
+        grad_outputs=grad_outputs,
+        create_graph=create_graph,
+        allow_unused=allow_unused)
+    jac_by_input = [
+        paddle.split(
+            paddle.reshape(
+                row[:n], shape=[n, -1]), out_sizes, axis=0)
+        if isinstance(row, paddle.Tensor) else [None] * len(outputs)
+        for row in rows
+    ]
+    return tuple(
+        tuple(jac_j[i] for jac_j in jac_by_input) for i in range(len(outputs)))
+
+
+def _diagonal_jacobian(x, output):
+    # An elementwise ``func`` has a diagonal Jacobian ``diag(d)`` with
+    # ``d = J^T 1``, in which case ``J^T v == d * v`` for every ``v``. The
+    # probe ``v`` is an irregular but fixed sequence in [1, 2) built on the
+    # device, so the check leaves the global random generator alone. The
+    # two sides may differ by the rounding of a differently ordered product,
+    # e.g. for ``paddle.nn.functional.sigmoid``, so they are compared up to
+    # a few ulps, which still keeps any off-diagonal entry that matters from
+    # passing. The check costs two backward passes and is only tried when
+    # the row-by-row computation needs more. Returns None if the Jacobian is
+    # not proven diagonal.
+    if x.dtype != output.dtype or x.dtype not in (
+            core.VarDesc.VarType.FP32, core.VarDesc.VarType.FP64):
+        return None
+    n = _numel(output)
+    if n <= 2:
+        return None
+    vjp_fn = _make_vjp([x], False, True)
+    d = vjp_fn([output], [paddle.ones_like(output)])[0]
+    if not isinstance(d, paddle.Tensor):
+        return None
+    v = paddle.arange(n, dtype=output.dtype) * 0.6180339887
+    v = paddle.reshape(v - paddle.floor(v) + 1., shape=output.shape)
+    probe = vjp_fn([output], [v])[0]
+    eps = np.finfo(
+        'float32' if x.dtype == core.VarDesc.VarType.FP32 else 'float64').eps
+    if not bool(paddle.allclose(probe, d * v, rtol=16 * eps, atol=0.)):
+        return None
+    return paddle.diag(paddle.reshape(d, shape=[-1]))
+
+
+def _linearized_vjp(inputs, outputs, allow_unused):
+    # Forward mode through the double-backward trick: ``vjp(u) = J^T u`` is
+    # linear in the cotangent ``u``, so differentiating it w.r.t. ``u`` along
+    # a tangent ``v`` of the inputs gives ``J v``. Returns the placeholder
+    # cotangents ``u`` and the graph of ``J^T u`` built on top of them.
+    cotangents = [paddle.zeros_like(output) for output in outputs]
+    for cotangent in cotangents:
+        cotangent.stop_gradient = False
+    vjps = _make_vjp(inputs, True, allow_unused)(list(outputs), cotangents)
+    return cotangents, vjps
+
+
+def _forward_jacobian(inputs, outputs, create_graph, allow_unused):
+    # Differentiating J^T u along a unit tangent of the j-th input gives one
+    # column of every J[i][j].
+    cotangents, vjps = _linearized_vjp(inputs, outputs, allow_unused)
+    vjp_cotangents = _make_vjp(cotangents, create_graph, True)
+    jacobian = list([] for _ in range(len(outputs)))
+    for j, x in enumerate(inputs):
+        if not isinstance(vjps[j], paddle.Tensor):
+            for jac_i in jacobian:
+                jac_i.append(None)
+            continue
+        jac_j = list([] for _ in range(len(outputs)))
+        for tangent in paddle.unbind(
+                paddle.eye(
+                    _numel(x), dtype=x.dtype), axis=0):
+            col_q = vjp_cotangents(
+                [vjps[j]], [paddle.reshape(
+                    tangent, shape=x.shape)])
+            for i in range(len(outputs)):
+                jac_j[i].append(
+                    paddle.reshape(
+                        col_q[i], shape=[-1])
+                    if isinstance(col_q[i], paddle.Tensor) else None)
+        for i, jac_i_j in enumerate(jac_j):
+            if not isinstance(jac_i_j[0], paddle.Tensor):
+                if not allow_unused:
+                    raise ValueError(
+                        "The {}-th input is unreachable from the {}-th output, "
+                        "please set allow_unused=True if this is expected.".
+                        format(j, i))
+                jacobian[i].append(None)
+            else:
+                jacobian[i].append(paddle.stack(jac_i_j, axis=1))
+    return tuple(tuple(jac_i) for jac_i in jacobian)
 
 
 @framework.dygraph_only
-def jacobian(func, inputs, create_graph=False, allow_unused=False):
+def jacobian(func,
+             inputs,
+             create_graph=False,
+             allow_unused=False,
+             vectorize=False,
+             mode='reverse'):
     ''' 
     .. note::
         **This API is ONLY available in imperative mode.**
@@ -62,6 +318,30 @@ def jacobian(func, inputs, create_graph=False, allow_unused=False):
             some Tensors of `inputs` are unreachable in the graph. Error would
             be raised if allow_unused=False, and None would be returned as
             their gradients if allow_unused=True. Default False.
+        vectorize (bool, optional): whether to compute all Jacobian matrices
+            with a single backward pass instead of one backward pass per row.
+            It requires ``func`` to broadcast over an extra leading axis of
+            its inputs: ``func`` is evaluated once more on inputs replicated
+            ``m`` times along that axis, where ``m`` is the total number of
+            elements of the outputs, so the memory used by the forward and
+            backward computation grows by a factor of ``m``. If the outputs
+            of ``func`` cannot be computed on the replicated inputs, do not
+            have the expected batched shape, or depend on more than their own
+            replica, the row-by-row computation is used instead. An input
+            which is unreachable from some but not all of the outputs gets
+            zero matrices for those outputs, instead of None when
+            ``allow_unused=True`` or an error when ``allow_unused=False``.
+            It only takes effect in reverse mode. Default False.
+        mode (str, optional): the differentiation mode, one of ``'reverse'``,
+            ``'forward'`` and ``'auto'``. Reverse mode computes the Jacobian
+            matrices row by row and needs one backward pass per output
+            element; forward mode computes them column by column and needs
+            one pass per input element, which is cheaper when the outputs
+            have more elements than the inputs. Forward mode is built on
+            double backward, so every operator used in ``func`` must support
+            second order gradients. ``'auto'`` picks forward mode when the
+            inputs have fewer elements than the outputs, and reverse mode
+            otherwise. Default ``'reverse'``.
     Returns:
         Jacobian (Tensor or nested tuple of Tensors): if function ``func``
         takes a Tensor as inputs and returns a Tensor as outputs, Jacobian
@@ -151,6 +431,10 @@ def jacobian(func, inputs, create_graph=False, allow_unused=False):
             #         [0., 0., 0., 2.]]), None))
 
     '''
+    if mode not in ('reverse', 'forward', 'auto'):
+        raise ValueError(
+            "mode must be 'reverse', 'forward' or 'auto', but got {}.".format(
+                mode))
     inputs = _check_tensors(inputs, "inputs")
     outputs = _check_tensors(func(*inputs), "outputs")
     fin_size = len(inputs)
@@ -158,28 +442,283 @@ def jacobian(func, inputs, create_graph=False, allow_unused=False):
     flat_outputs = tuple(
         paddle.reshape(
             output, shape=[-1]) for output in outputs)
+    if (fin_size == 1 and fout_size == 1 and not create_graph and
+            inputs[0].shape == outputs[0].shape):
+        jacobian = _diagonal_jacobian(inputs[0], outputs[0])
+        if jacobian is not None:
+            return jacobian
+    if mode == 'auto':
+        n_in = sum(_numel(x) for x in inputs)
+        n_out = sum(_numel(output) for output in outputs)
+        mode = 'forward' if n_in < n_out else 'reverse'
+    jacobian = None
+    if mode == 'forward':
+        jacobian = _forward_jacobian(inputs, outputs, create_graph,
+                                     allow_unused)
+    elif vectorize:
+        jacobian = _vectorized_jacobian(func, inputs, outputs, create_graph,
+                                        allow_unused)
+    if jacobian is None:
+        jacobian = tuple(
+            _jacobian_rows(
+                flat_output,
+                inputs,
+                create_graph,
+                allow_unused,
+                release_graph=(i == fout_size - 1))
+            for i, flat_output in enumerate(flat_outputs))
+    return _unpack_jacobian(jacobian, fin_size, fout_size)
+
+
+@framework.dygraph_only
+def batch_jacobian(func,
+                   inputs,
+                   create_graph=False,
+                   allow_unused=False,
+                   batch_axis=0):
+    '''
+    .. note::
+        **This API is ONLY available in imperative mode.**
+
+    This API computes the Jacobian matrices of `func` with respect to `inputs`
+    for every sample of a batch. It assumes that the ``b``th sample of the
+    outputs only depends on the ``b``th sample of the inputs, which holds for
+    most networks without cross-sample operators such as batch norm. Under
+    this assumption the gradients of different samples do not mix, and the
+    Jacobian matrices of the whole batch are computed with one backward pass
+    per output element of a single sample, instead of one per output element
+    of the batch as ``jacobian`` does.
+
+    Parameters:
+        func (function): a Python function that takes a Tensor or a Tensor
+            list/tuple as inputs and returns a Tensor or a Tensor tuple.
+        inputs (Tensor|list(Tensor)|tuple(Tensor)): the input Tensor or
+            Tensor list/tuple of the function ``func``. All of them must
+            have the same size along ``batch_axis``.
+        create_graph (bool, optional): whether to create the gradient graphs
+            of the computing process. When it is True, higher order derivatives
+            are supported to compute; when it is False, the gradient graphs of
+            the computing process would be discarded. Defaults to ``False``.
+        allow_unused (bool, optional): whether to raise error or return None if
+            some Tensors of `inputs` are unreachable in the graph. Error would
+            be raised if allow_unused=False, and None would be returned as
+            their gradients if allow_unused=True. Default False.
+        batch_axis (int, optional): the batch axis of the inputs and the
+            outputs of ``func``. Default 0.
+    Returns:
+        Jacobian (Tensor or nested tuple of Tensors): the same nesting as
+        the result of ``jacobian``, where ``Jacobian[i][j]`` has shape
+        ``[B, m, n]``. ``B`` is the batch size, and ``m`` and ``n`` denote
+        the numbers of elements of one sample of the ``i``th output and the
+        ``j``th input respectively.
+
+    Examples:
+        .. code-block:: python
+
+            import paddle
+
+            def func(x):
+                return x * x
+
+            x = paddle.to_tensor([[1., 2.], [3., 4.]])
+            x.stop_gradient = False
+            jacobian = paddle.autograd.batch_jacobian(func, x)
+            print(jacobian)
+            # Tensor(shape=[2, 2, 2], dtype=float32, place=CUDAPlace(0), stop_gradient=True,
+            #        [[[2., 0.],
+            #          [0., 4.]],
+            #         [[6., 0.],
+            #          [0., 8.]]])
+
+    '''
+    inputs = _check_tensors(inputs, "inputs")
+    outputs = _check_tensors(func(*inputs), "outputs")
+    fin_size = len(inputs)
+    fout_size = len(outputs)
+    batch_size = inputs[0].shape[batch_axis]
+    for t in list(inputs) + list(outputs):
+        if t.shape[batch_axis] != batch_size:
+            raise ValueError(
+                "All inputs and outputs must have the same size {} along "
+                "batch_axis, but got a Tensor of shape {}.".format(batch_size,
+                                                                   t.shape))
+    vjp_fn = _make_vjp(inputs, create_graph, allow_unused)
     jacobian = tuple()
-    for i, flat_output in enumerate(flat_outputs):
+    for output in outputs:
+        flat_output = paddle.reshape(
+            _move_axis_to_front(output, batch_axis), shape=[batch_size, -1])
         jac_i = list([] for _ in range(fin_size))
-        for k in range(len(flat_output)):
-            row_k = paddle.grad(
-                flat_output[k],
-                inputs,
-                create_graph=create_graph,
-                retain_graph=True,
-                allow_unused=allow_unused)
+        # Backpropagating a whole column sums the k-th element over the
+        # batch, which still separates per sample since samples are
+        # independent.
+        for k in range(flat_output.shape[1]):
+            row_k = vjp_fn([flat_output[:, k]])
             for j in range(fin_size):
                 jac_i[j].append(
                     paddle.reshape(
-                        row_k[j], shape=[-1])
+                        _move_axis_to_front(row_k[j], batch_axis),
+                        shape=[batch_size, -1])
                     if isinstance(row_k[j], paddle.Tensor) else None)
         jacobian += (tuple(
-            _stack_tensor_or_return_none(jac_i_j) for jac_i_j in jac_i), )
-    if fin_size == 1 and fout_size == 1:
-        return jacobian[0][0]
-    elif fin_size == 1 and fout_size != 1:
-        return tuple(jacobian[i][0] for i in range(fout_size))
-    elif fin_size != 1 and fout_size == 1:
-        return jacobian[0]
+            _stack_tensor_or_return_none(
+                jac_i_j, axis=1) for jac_i_j in jac_i), )
+    return _unpack_jacobian(jacobian, fin_size, fout_size)
+
+
+def _check_v(v, targets, name):
+    # The vectors bypass paddle.grad's checks on their way to the engine, so
+    # validate them here. A None vector, or None entry, means ones.
+    if v is None:
+        return [paddle.ones_like(t) for t in targets]
+    if isinstance(v, paddle.Tensor):
+        v = [v]
+    if not isinstance(v, (list, tuple)):
+        raise TypeError("v must be None, a Tensor or a list of Tensor/None")
+    if len(v) != len(targets):
+        raise ValueError(
+            "The length of v must be equal to the number of {}, but got {} "
+            "and {}.".format(name, len(v), len(targets)))
+    checked = []
+    for i, (v_i, t) in enumerate(zip(v, targets)):
+        if v_i is None:
+            checked.append(paddle.ones_like(t))
+            continue
+        if not isinstance(v_i, paddle.Tensor):
+            raise TypeError("The {}-th element of v must be a Tensor or None".
+                            format(i))
+        if v_i.shape != t.shape:
+            raise ValueError(
+                "The {}-th element of v must have the same shape as the {}-th "
+                "of {}, but got {} and {}.".format(i, i, name, v_i.shape,
+                                                   t.shape))
+        checked.append(v_i)
+    return checked
+
+
+@framework.dygraph_only
+def vjp(func, inputs, v=None, create_graph=False, allow_unused=False):
+    '''
+    .. note::
+        **This API is ONLY available in imperative mode.**
+
+    This API computes the vector-Jacobian product ``v^T J`` of `func` with
+    respect to `inputs`, where ``J`` is the Jacobian matrix computed by
+    ``jacobian``. It only needs one backward pass, so prefer it to
+    ``jacobian`` when the Jacobian matrix is only multiplied with a vector,
+    e.g. in Newton-CG or influence function workloads.
+
+    Parameters:
+        func (function): a Python function that takes a Tensor or a Tensor
+            list/tuple as inputs and returns a Tensor or a Tensor tuple.
+        inputs (Tensor|list(Tensor)|tuple(Tensor)): the input Tensor or
+            Tensor list/tuple of the function ``func``.
+        v (Tensor|list(Tensor|None)|tuple(Tensor|None), optional): the
+            vector with the same structure and shapes as the outputs of
+            ``func``. Tensors filled with 1 are used if it is None, or for
+            its None elements. Default None.
+        create_graph (bool, optional): whether to create the gradient graphs
+            of the computing process. When it is True, higher order derivatives
+            are supported to compute; when it is False, the gradient graphs of
+            the computing process would be discarded. Defaults to ``False``.
+        allow_unused (bool, optional): whether to raise error or return None if
+            some Tensors of `inputs` are unreachable in the graph. Error would
+            be raised if allow_unused=False, and None would be returned as
+            their gradients if allow_unused=True. Default False.
+    Returns:
+        Tensor or tuple of Tensors: ``v^T J`` with the same structure and
+        shapes as ``inputs``.
+
+    Examples:
+        .. code-block:: python
+
+            import paddle
+
+            def func(x):
+                return paddle.matmul(x, x)
+
+            x = paddle.ones(shape=[2, 2], dtype='float32')
+            x.stop_gradient = False
+            v = paddle.to_tensor([[1., 0.], [0., 0.]])
+            vjp = paddle.autograd.vjp(func, x, v)
+            print(vjp)
+            # Tensor(shape=[2, 2], dtype=float32, place=CUDAPlace(0), stop_gradient=True,
+            #        [[2., 1.],
+            #         [1., 0.]])
+
+    '''
+    is_single_input = isinstance(inputs, paddle.Tensor)
+    inputs = _check_tensors(inputs, "inputs")
+    outputs = _check_tensors(func(*inputs), "outputs")
+    v = _check_v(v, outputs, "outputs of func")
+    grads = _make_vjp(inputs, create_graph, allow_unused)(
+        list(outputs), v, retain_graph=create_graph)
+    return grads[0] if is_single_input else tuple(grads)
+
+
+@framework.dygraph_only
+def jvp(func, inputs, v=None, create_graph=False, allow_unused=False):
+    '''
+    .. note::
+        **This API is ONLY available in imperative mode.**
+
+    This API computes the Jacobian-vector product ``J v`` of `func` with
+    respect to `inputs`, where ``J`` is the Jacobian matrix computed by
+    ``jacobian``. It is computed with two backward passes (the gradient of
+    ``J^T u`` with respect to ``u``), so every operator used in ``func`` must
+    support second order gradients. Prefer it to ``jacobian`` when the
+    Jacobian matrix is only multiplied with a vector, e.g. Hessian-vector
+    products are the ``jvp`` of a function returning gradients.
+
+    Parameters:
+        func (function): a Python function that takes a Tensor or a Tensor
+            list/tuple as inputs and returns a Tensor or a Tensor tuple.
+        inputs (Tensor|list(Tensor)|tuple(Tensor)): the input Tensor or
+            Tensor list/tuple of the function ``func``.
+        v (Tensor|list(Tensor|None)|tuple(Tensor|None), optional): the
+            vector with the same structure and shapes as ``inputs``. Tensors
+            filled with 1 are used if it is None, or for its None elements.
+            Default None.
+        create_graph (bool, optional): whether to create the gradient graphs
+            of the computing process. When it is True, higher order derivatives
+            are supported to compute; when it is False, the gradient graphs of
+            the computing process would be discarded. Defaults to ``False``.
+        allow_unused (bool, optional): whether to raise error or return None if
+            some Tensors of `inputs` or outputs of ``func`` are unreachable in
+            the graph. Error would be raised if allow_unused=False, and None
+            would be returned if allow_unused=True. Default False.
+    Returns:
+        Tensor or tuple of Tensors: ``J v`` with the same structure and
+        shapes as the outputs of ``func``.
+
+    Examples:
+        .. code-block:: python
+
+            import paddle
+
+            def func(x):
+                return paddle.matmul(x, x)
+
+            x = paddle.ones(shape=[2, 2], dtype='float32')
+            x.stop_gradient = False
+            v = paddle.to_tensor([[1., 0.], [0., 0.]])
+            jvp = paddle.autograd.jvp(func, x, v)
+            print(jvp)
+            # Tensor(shape=[2, 2], dtype=float32, place=CUDAPlace(0), stop_gradient=True,
+            #        [[2., 1.],
+            #         [1., 0.]])
+
+    '''
+    inputs = _check_tensors(inputs, "inputs")
+    outputs = func(*inputs)
+    is_single_output = isinstance(outputs, paddle.Tensor)
+    outputs = _check_tensors(outputs, "outputs")
+    v = _check_v(v, inputs, "inputs")
+    cotangents, vjps = _linearized_vjp(inputs, outputs, allow_unused)
+    reachable = [j for j, g in enumerate(vjps) if isinstance(g, paddle.Tensor)]
+    if len(reachable) == 0:
+        results = [None] * len(outputs)
     else:
-        return jacobian
+        results = _make_vjp(cotangents, create_graph, allow_unused)(
+            [vjps[j] for j in reachable], [v[j] for j in reachable],
+            retain_graph=create_graph)
+    return results[0] if is_single_output else tuple(results)
@@ -0,0 +1,119 @@
+# Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+# 
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+import paddle
+
+
+def _diagonal_blocks(jacobian, batch_size):
+    m = jacobian.shape[0] // batch_size
+    n = jacobian.shape[1] // batch_size
+    return np.stack([
+        jacobian[b * m:(b + 1) * m, b * n:(b + 1) * n]
+        for b in range(batch_size)
+    ])
+
+
+class TestBatchJacobian(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        self.batch_size = 3
+        self.dtype = 'float32'
+        self.rtol = 1e-5
+        self.atol = 1e-5
+        self.x = paddle.rand(shape=[self.batch_size, 4], dtype=self.dtype)
+        self.y = paddle.rand(shape=[self.batch_size, 4], dtype=self.dtype)
+        self.w = paddle.rand(shape=[4, 2], dtype=self.dtype)
+
+    def test_single_input_and_single_output(self):
+        def func(x):
+            return paddle.matmul(paddle.tanh(x), self.w)
+
+        self.x.stop_gradient = False
+        expected = _diagonal_blocks(
+            paddle.autograd.jacobian(func, self.x).numpy(), self.batch_size)
+        batch_jacobian = paddle.autograd.batch_jacobian(func, self.x)
+        self.assertEqual(batch_jacobian.shape, [self.batch_size, 2, 4])
+        assert np.allclose(batch_jacobian.numpy(), expected, self.rtol,
+                           self.atol)
+
+    def test_multi_input_and_multi_output(self):
+        def func(x, y):
+            return paddle.matmul(x * y, self.w), x * x
+
+        self.x.stop_gradient = False
+        self.y.stop_gradient = False
+        jacobian = paddle.autograd.jacobian(
+            func, [self.x, self.y], allow_unused=True)
+        batch_jacobian = paddle.autograd.batch_jacobian(
+            func, [self.x, self.y], allow_unused=True)
+        for i in range(len(jacobian)):
+            for j in range(len(jacobian[0])):
+                if jacobian[i][j] is None:
+                    assert batch_jacobian[i][j] is None
+                    continue
+                expected = _diagonal_blocks(jacobian[i][j].numpy(),
+                                            self.batch_size)
+                assert np.allclose(batch_jacobian[i][j].numpy(), expected,
+                                   self.rtol, self.atol)
+
+    def test_batch_axis(self):
+        def func(x):
+            return paddle.tanh(x) * 2.
+
+        x = paddle.transpose(self.x, perm=[1, 0])
+        x.stop_gradient = False
+        self.x.stop_gradient = False
+        expected = paddle.autograd.batch_jacobian(func, self.x)
+        batch_jacobian = paddle.autograd.batch_jacobian(func, x, batch_axis=1)
+        assert np.allclose(batch_jacobian.numpy(),
+                           expected.numpy(), self.rtol, self.atol)
+
+    def test_negative_batch_axis(self):
+        def func(x):
+            return paddle.tanh(x) * 2.
+
+        x = paddle.transpose(self.x, perm=[1, 0])
+        x.stop_gradient = False
+        self.x.stop_gradient = False
+        expected = paddle.autograd.batch_jacobian(func, self.x)
+        batch_jacobian = paddle.autograd.batch_jacobian(func, x, batch_axis=-1)
+        assert np.allclose(batch_jacobian.numpy(),
+                           expected.numpy(), self.rtol, self.atol)
+
+    def test_create_graph(self):
+        def func(x):
+            return paddle.matmul(paddle.tanh(x), self.w)
+
+        self.x.stop_gradient = False
+        expected = paddle.autograd.batch_jacobian(func, self.x)
+        batch_jacobian = paddle.autograd.batch_jacobian(
+            func, self.x, create_graph=True)
+        assert batch_jacobian.stop_gradient == False
+        assert np.allclose(batch_jacobian.numpy(),
+                           expected.numpy(), self.rtol, self.atol)
+        double_grad = paddle.grad(batch_jacobian, self.x)
+        assert double_grad is not None
+
+    def test_mismatched_batch_size(self):
+        def func(x, y):
+            return x
+
+        self.assertRaises(ValueError, paddle.autograd.batch_jacobian, func,
+                          [self.x, self.w])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,7 +16,7 @@ import unittest
 import numpy as np
 import paddle
 import paddle.compat as cpt
-from paddle.autograd.functional import _check_tensors
+from paddle.autograd.functional import _check_tensors, _diagonal_jacobian
 
 
 def _product(t):
@@ -100,6 +100,43 @@ class TestJacobian(unittest.TestCase):
         assert np.allclose(jacobian.numpy(), numerical_jacobian[0][0],
                            self.rtol, self.atol)
 
+    def test_elementwise_func(self):
+        self.x.stop_gradient = False
+        assert _diagonal_jacobian(self.x, paddle.tanh(self.x)) is not None
+        jacobian = paddle.autograd.jacobian(paddle.tanh, self.x)
+        expected = np.diag(1. - np.tanh(self.x.numpy().reshape([-1]))**2)
+        assert np.allclose(jacobian.numpy(), expected, self.rtol, self.atol)
+
+    def test_elementwise_func_with_rounding(self):
+        sigmoid = paddle.nn.functional.sigmoid
+        self.x.stop_gradient = False
+        assert _diagonal_jacobian(self.x, sigmoid(self.x)) is not None
+        jacobian = paddle.autograd.jacobian(sigmoid, self.x)
+        s = 1. / (1. + np.exp(-self.x.numpy().reshape([-1])))
+        expected = np.diag(s * (1. - s))
+        assert np.allclose(jacobian.numpy(), expected, self.rtol, self.atol)
+
+    def test_non_diagonal_func_of_same_shape(self):
+        def func(x):
+            return paddle.matmul(x, x)
+
+        numerical_jacobian = _compute_numerical_jacobian(
+            func, self.x, self.numerical_delta, self.np_dtype)
+        self.x.stop_gradient = False
+        assert _diagonal_jacobian(self.x, func(self.x)) is None
+        jacobian = paddle.autograd.jacobian(func, self.x)
+        assert np.allclose(jacobian.numpy(), numerical_jacobian[0][0],
+                           self.rtol, self.atol)
+
+    def test_invalid_mode(self):
+        self.x.stop_gradient = False
+        self.assertRaises(
+            ValueError,
+            paddle.autograd.jacobian,
+            paddle.tanh,
+            self.x,
+            mode='bogus')
+
     def test_single_input_and_multi_output(self):
         def func(x):
             return paddle.matmul(x, x), x * x
@@ -202,6 +239,96 @@ class TestJacobian(unittest.TestCase):
         double_grad = paddle.grad(jacobian[0], [self.x, self.y])
         assert double_grad is not None
 
+    def test_vectorize(self):
+        def func(x, y):
+            return paddle.matmul(x, y), x * y
+
+        numerical_jacobian = _compute_numerical_jacobian(
+            func, [self.x, self.y], self.numerical_delta, self.np_dtype)
+        self.x.stop_gradient = False
+        self.y.stop_gradient = False
+        jacobian = paddle.autograd.jacobian(
+            func, [self.x, self.y], vectorize=True)
+        for i in range(len(jacobian)):
+            for j in range(len(jacobian[0])):
+                assert np.allclose(jacobian[i][j].numpy(),
+                                   numerical_jacobian[i][j], self.rtol,
+                                   self.atol)
+
+    def test_vectorize_fallback(self):
+        def func(x):
+            return paddle.sum(x * x)
+
+        numerical_jacobian = _compute_numerical_jacobian(
+            func, self.x, self.numerical_delta, self.np_dtype)
+        self.x.stop_gradient = False
+        jacobian = paddle.autograd.jacobian(func, self.x, vectorize=True)
+        assert np.allclose(jacobian.numpy(), numerical_jacobian[0][0],
+                           self.rtol, self.atol)
+
+    def test_vectorize_fallback_on_reduction(self):
+        def func(x):
+            return x * paddle.sum(x)
+
+        numerical_jacobian = _compute_numerical_jacobian(
+            func, self.x, self.numerical_delta, self.np_dtype)
+        self.x.stop_gradient = False
+        jacobian = paddle.autograd.jacobian(func, self.x, vectorize=True)
+        assert np.allclose(jacobian.numpy(), numerical_jacobian[0][0],
+                           self.rtol, self.atol)
+
+    def test_vectorize_fallback_on_replica_invariant_mixing(self):
+        def func(x):
+            return x - paddle.mean(x), x / x.max()
+
+        numerical_jacobian = _compute_numerical_jacobian(
+            func, self.x, self.numerical_delta, self.np_dtype)
+        self.x.stop_gradient = False
+        jacobian = paddle.autograd.jacobian(func, self.x, vectorize=True)
+        for i in range(len(jacobian)):
+            assert np.allclose(jacobian[i].numpy(), numerical_jacobian[i][0],
+                               self.rtol, self.atol)
+
+    def test_vectorize_fallback_on_unbatched_func(self):
+        def func(x):
+            return paddle.transpose(x, [1, 0]), paddle.reshape(x, [2, 8])
+
+        numerical_jacobian = _compute_numerical_jacobian(
+            func, self.x, self.numerical_delta, self.np_dtype)
+        self.x.stop_gradient = False
+        jacobian = paddle.autograd.jacobian(func, self.x, vectorize=True)
+        for i in range(len(jacobian)):
+            assert np.allclose(jacobian[i].numpy(), numerical_jacobian[i][0],
+                               self.rtol, self.atol)
+
+    def test_forward_mode(self):
+        def func(x, y):
+            return paddle.matmul(x, y), x * y
+
+        numerical_jacobian = _compute_numerical_jacobian(
+            func, [self.x, self.y], self.numerical_delta, self.np_dtype)
+        self.x.stop_gradient = False
+        self.y.stop_gradient = False
+        jacobian = paddle.autograd.jacobian(
+            func, [self.x, self.y], mode='forward')
+        for i in range(len(jacobian)):
+            for j in range(len(jacobian[0])):
+                assert np.allclose(jacobian[i][j].numpy(),
+                                   numerical_jacobian[i][j], self.rtol,
+                                   self.atol)
+
+    def test_auto_mode(self):
+        def func(x):
+            return paddle.matmul(x, x), x * x
+
+        numerical_jacobian = _compute_numerical_jacobian(
+            func, self.x, self.numerical_delta, self.np_dtype)
+        self.x.stop_gradient = False
+        jacobian = paddle.autograd.jacobian(func, self.x, mode='auto')
+        for i in range(len(jacobian)):
+            assert np.allclose(jacobian[i].numpy(), numerical_jacobian[i][0],
+                               self.rtol, self.atol)
+
 
 class TestJacobianFloat64(TestJacobian):
     @classmethod
@@ -0,0 +1,124 @@
+# Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+# 
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+import paddle
+
+
+class TestVJPAndJVP(unittest.TestCase):
+    @classmethod
+    def setUpClass(self):
+        self.shape = (4, 4)
+        self.dtype = 'float64'
+        self.rtol = 1e-7
+        self.atol = 1e-7
+        self.x = paddle.rand(shape=self.shape, dtype=self.dtype)
+        self.y = paddle.rand(shape=self.shape, dtype=self.dtype)
+        self.vx = paddle.rand(shape=self.shape, dtype=self.dtype)
+        self.vy = paddle.rand(shape=self.shape, dtype=self.dtype)
+
+    def func(self, x, y):
+        return paddle.matmul(x, y), x * y
+
+    def test_vjp(self):
+        self.x.stop_gradient = False
+        self.y.stop_gradient = False
+        jacobian = paddle.autograd.jacobian(self.func, [self.x, self.y])
+        vjp = paddle.autograd.vjp(self.func, [self.x, self.y],
+                                  [self.vx, self.vy])
+        v = [self.vx.numpy().reshape([-1]), self.vy.numpy().reshape([-1])]
+        for j in range(len(vjp)):
+            expected = sum(
+                np.matmul(v[i], jacobian[i][j].numpy()) for i in range(2))
+            assert np.allclose(vjp[j].numpy().reshape([-1]), expected,
+                               self.rtol, self.atol)
+
+    def test_jvp(self):
+        self.x.stop_gradient = False
+        self.y.stop_gradient = False
+        jacobian = paddle.autograd.jacobian(self.func, [self.x, self.y])
+        jvp = paddle.autograd.jvp(self.func, [self.x, self.y],
+                                  [self.vx, self.vy])
+        v = [self.vx.numpy().reshape([-1]), self.vy.numpy().reshape([-1])]
+        for i in range(len(jvp)):
+            expected = sum(
+                np.matmul(jacobian[i][j].numpy(), v[j]) for j in range(2))
+            assert np.allclose(jvp[i].numpy().reshape([-1]), expected,
+                               self.rtol, self.atol)
+
+    def test_single_input_and_single_output(self):
+        def func(x):
+            return paddle.tanh(x)
+
+        self.x.stop_gradient = False
+        expected = (1 - np.tanh(self.x.numpy())**2) * self.vx.numpy()
+        vjp = paddle.autograd.vjp(func, self.x, self.vx)
+        jvp = paddle.autograd.jvp(func, self.x, self.vx)
+        assert np.allclose(vjp.numpy(), expected, self.rtol, self.atol)
+        assert np.allclose(jvp.numpy(), expected, self.rtol, self.atol)
+
+    def test_allow_unused(self):
+        def func(x, y):
+            return x * x
+
+        self.x.stop_gradient = False
+        self.y.stop_gradient = False
+        vjp = paddle.autograd.vjp(
+            func, [self.x, self.y], self.vx, allow_unused=True)
+        assert np.allclose(vjp[0].numpy(),
+                           2 * self.x.numpy() * self.vx.numpy(), self.rtol,
+                           self.atol)
+        assert vjp[1] is None
+        jvp = paddle.autograd.jvp(
+            func, [self.x, self.y], [self.vx, None], allow_unused=True)
+        assert np.allclose(jvp.numpy(), 2 * self.x.numpy() * self.vx.numpy(),
+                           self.rtol, self.atol)
+
+    def test_create_graph(self):
+        def func(x):
+            return x * x
+
+        self.x.stop_gradient = False
+        vjp = paddle.autograd.vjp(func, self.x, self.vx, create_graph=True)
+        jvp = paddle.autograd.jvp(func, self.x, self.vx, create_graph=True)
+        expected = 2 * self.x.numpy() * self.vx.numpy()
+        for result in (vjp, jvp):
+            assert result.stop_gradient == False
+            assert np.allclose(result.numpy(), expected, self.rtol, self.atol)
+        double_grad = paddle.grad(vjp, self.x)[0]
+        assert np.allclose(double_grad.numpy(), 2 * self.vx.numpy(),
+                           self.rtol, self.atol)
+
+    def test_none_v(self):
+        self.x.stop_gradient = False
+        self.y.stop_gradient = False
+        vjp = paddle.autograd.vjp(self.func, [self.x, self.y], [None, None])
+        expected = paddle.autograd.vjp(self.func, [self.x, self.y])
+        for j in range(len(vjp)):
+            assert np.allclose(vjp[j].numpy(), expected[j].numpy(),
+                               self.rtol, self.atol)
+
+    def test_v_shape_mismatch(self):
+        self.x.stop_gradient = False
+        self.y.stop_gradient = False
+        v = [self.vx, paddle.ones(shape=[2, 2], dtype=self.dtype)]
+        self.assertRaises(ValueError, paddle.autograd.vjp, self.func,
+                          [self.x, self.y], v)
+        self.assertRaises(ValueError, paddle.autograd.jvp, self.func,
+                          [self.x, self.y], v)
+
+
+if __name__ == "__main__":
+    unittest.main()
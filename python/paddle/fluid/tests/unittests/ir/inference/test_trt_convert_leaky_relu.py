@@ -21,45 +21,55 @@ from functools import partial
 from typing import Optional, List, Callable, Dict, Any, Set
 import unittest
 
+# The harness only reads the input data, so every program shares one
+# read-only array.
+_ONES_1x3x64x64 = np.ones([1, 3, 64, 64], dtype=np.float32)
+_ONES_1x3x64x64.setflags(write=False)
+
+# The part of the op config shared by all programs, only the attrs vary.
+_BASE_OP_CONFIG = {
+    "op_type": "leaky_relu",
+    "op_inputs": {
+        "X": ["input_data"],
+    },
+    "op_outputs": {
+        "Out": ["y_data"],
+    }
+}
+
 
 class TrtConvertLeakyReluTest(TrtLayerAutoScanTest):
     def is_program_valid(self, program_config: ProgramConfig) -> bool:
         return True
 
     def sample_program_configs(self):
-        def generate_input1(attrs: List[Dict[str, Any]]):
-            return np.ones([1, 3, 64, 64]).astype(np.float32)
-
+        # X_scale only feeds the int8 dynamic range, and run_test() without
+        # quant skips every Int8 predictor config, so sweeping it would only
+        # rerun the same fp engines.
         for alpha in [0.02, 1.0, 100.0, -1.0, 0.0]:
-            for X_scale in [1.0, 100.0, 0.01, -0.1, 0.0]:
-                dics = [{
-                    "alpha": alpha,
-                    "use_mkldnn": True,
-                    "enable_int8": True,
-                    "X_scale": X_scale
-                }]
-
-                ops_config = [{
-                    "op_type": "leaky_relu",
-                    "op_inputs": {
-                        "X": ["input_data"],
-                    },
-                    "op_outputs": {
-                        "Out": ["y_data"],
-                    },
-                    "op_attrs": dics[0]
-                }]
-                ops = self.generate_op_config(ops_config)
-                program_config = ProgramConfig(
-                    ops=ops,
-                    weights={},
-                    inputs={
-                        "input_data":
-                        TensorConfig(data_gen=partial(generate_input1, dics))
-                    },
-                    outputs=["y_data"])
-
-                yield program_config
+            yield self.generate_program_config(alpha)
+
+    def generate_program_config(self, alpha):
+        def generate_input1(attrs: List[Dict[str, Any]]):
+            return _ONES_1x3x64x64
+
+        attrs = {
+            "alpha": alpha,
+            "use_mkldnn": True,
+            "enable_int8": True,
+            "X_scale": 1.0
+        }
+        ops = self.generate_op_config([{**_BASE_OP_CONFIG, "op_attrs": attrs}])
+        program_config = ProgramConfig(
+            ops=ops,
+            weights={},
+            inputs={
+                "input_data":
+                TensorConfig(data_gen=partial(generate_input1, [attrs]))
+            },
+            outputs=["y_data"])
+
+        return program_config
 
     def sample_predictor_configs(
             self, program_config) -> (paddle_infer.Config, List[int], float):
@@ -81,31 +91,34 @@ class TrtConvertLeakyReluTest(TrtLayerAutoScanTest):
             for i in range(len(program_config.ops))
         ]
 
+        # Int8 is left out since run_test() without quant skips it anyway.
+        precisions = [
+            paddle_infer.PrecisionType.Float32,
+            paddle_infer.PrecisionType.Half
+        ]
+        tolerances = {
+            paddle_infer.PrecisionType.Float32: 1e-5,
+            paddle_infer.PrecisionType.Half: (1e-5, 1e-5)
+        }
+
         # for static_shape
         clear_dynamic_shape()
-        self.trt_param.precision = paddle_infer.PrecisionType.Float32
-        yield self.create_inference_config(), generate_trt_nodes_num(
-            attrs, False), 1e-5
-        self.trt_param.precision = paddle_infer.PrecisionType.Half
-        yield self.create_inference_config(), generate_trt_nodes_num(
-            attrs, False), (1e-5, 1e-5)
-        self.trt_param.precision = paddle_infer.PrecisionType.Int8
-        yield self.create_inference_config(), generate_trt_nodes_num(
-            attrs, False), (1e-5, 1e-5)
+        for precision in precisions:
+            self.trt_param.precision = precision
+            yield self.create_inference_config(), generate_trt_nodes_num(
+                attrs, False), tolerances[precision]
 
         # for dynamic_shape
         generate_dynamic_shape(attrs)
-        self.trt_param.precision = paddle_infer.PrecisionType.Float32
-        yield self.create_inference_config(), generate_trt_nodes_num(attrs,
-                                                                     True), 1e-5
-        self.trt_param.precision = paddle_infer.PrecisionType.Half
-        yield self.create_inference_config(), generate_trt_nodes_num(
-            attrs, True), (1e-5, 1e-5)
-        self.trt_param.precision = paddle_infer.PrecisionType.Int8
-        yield self.create_inference_config(), generate_trt_nodes_num(
-            attrs, True), (1e-5, 1e-5)
+        for precision in precisions:
+            self.trt_param.precision = precision
+            yield self.create_inference_config(), generate_trt_nodes_num(
+                attrs, True), tolerances[precision]
 
     def test(self):
+        # With only five programs, sampling a fraction of them in CI would
+        # often run none, so always run them all.
+        self.num_percent_cases = 1.0
         self.run_test()
 
 